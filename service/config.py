@@ -13,7 +13,13 @@ DATABASE_URI = os.getenv(
 # Configure SQLAlchemy
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
-# SQLALCHEMY_POOL_SIZE = 2
+
+# Optional connection pool sizing; unset or non-numeric values keep SQLAlchemy's defaults
+SQLALCHEMY_ENGINE_OPTIONS = {}
+if os.getenv("DATABASE_POOL_SIZE", "").isdigit():
+    SQLALCHEMY_ENGINE_OPTIONS["pool_size"] = int(os.getenv("DATABASE_POOL_SIZE"))
+if os.getenv("DATABASE_MAX_OVERFLOW", "").isdigit():
+    SQLALCHEMY_ENGINE_OPTIONS["max_overflow"] = int(os.getenv("DATABASE_MAX_OVERFLOW"))
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
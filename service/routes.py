@@ -19,7 +19,7 @@
 Product Store Service with UI
 """
 from flask import jsonify, request, abort
-from flask import url_for  # noqa: F401 pylint: disable=unused-import
+from flask import url_for
 from service.models import Product, Category
 from service.common import status  # HTTP Status Codes
 from . import app
@@ -92,11 +92,7 @@ def create_products():
 
     message = product.serialize()
 
-    #
-    # Uncomment this line of code once you implement READ A PRODUCT
-    #
     location_url = url_for("get_products", product_id=product.id, _external=True)
-    location_url = "/"  # delete once READ is implemented
     return jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
 
 